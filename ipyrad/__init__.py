@@ -6,6 +6,7 @@ from .core.load import load_json
 from .core.Parallel import cluster_info
 import os as _os
 import sys as _sys
+import shutil as _shutil
 import subprocess as _sps
 
 # Dunders
@@ -42,11 +43,7 @@ for binary, path in bins.__dict__.items():
         setattr(bins, binary, binary)
 
         # if not then check for binary in PATH (less reliable versioned...)
-        cmd = ['which', binary]
-        proc = _sps.Popen(cmd, stderr=_sps.STDOUT, stdout=_sps.PIPE)
-        errmsg = proc.communicate()[0]
-        if proc.returncode:
-            print(errmsg.decode())
+        if not _shutil.which(binary):
             raise ImportError(_IMPORT_ERROR.format(binary, binary))
 
 
@@ -2,14 +2,28 @@
 
 """ import assembly funcs """
 
-from . import demultiplex
-from . import rawedit
-from . import clustmap
-from . import jointestimate
-from . import consens_se
-from . import clustmap_across
-from . import write_outputs
-from . import utils
+# step modules are imported lazily (PEP 562) so that 'import ipyrad'
+# does not pay for numba/pandas in every step module up front; they
+# load on first attribute access, e.g. ip.assemble.demultiplex.
+import importlib
+
+_SUBMODULES = (
+    "demultiplex",
+    "rawedit",
+    "clustmap",
+    "jointestimate",
+    "consens_se",
+    "clustmap_across",
+    "write_outputs",
+    "utils",
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
 
 # from . import refmap
 # from . import cluster_across
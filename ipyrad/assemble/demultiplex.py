@@ -14,8 +14,11 @@ except ImportError:
 # external imports
 import os
 import io
+import re
 import gzip
 import glob
+import mmap
+import fnmatch
 import time
 import shutil
 import pickle
@@ -27,6 +30,10 @@ from collections import Counter
 from ipyrad.core.sample import Sample
 from ipyrad.assemble.utils import IPyradError, ambigcutters, BADCHARS
 
+# strips any run of allowed file extensions from the end of a name
+EXTENSIONS_RE = re.compile(r"(?:\.(?:gz|fastq|fq|fasta|clustS|consens))+$")
+READ1_RE = re.compile(r"_R1_\.|_R1_|_R1\.")
+
 
 
 class Step1:
@@ -138,7 +145,7 @@ class FileLinker:
     def __init__(self, step):
         self.data = step.data
         self.input = step.sfiles
-        self.fastqs = glob.glob(self.input)
+        self.fastqs = scanglob(self.input)
         self.ftuples = []
 
         # parallel distributor
@@ -155,7 +162,7 @@ class FileLinker:
 
     def check_files(self):
         # Assert files are not .bz2 format
-        if any([i.endswith(".bz2") for i in self.fastqs]):
+        if any(i.endswith(".bz2") for i in self.fastqs):
             raise IPyradError(NO_SUPPORT_FOR_BZ2.format(self.input))
 
         # filter out any files without proper file endings. Raise if None
@@ -168,9 +175,14 @@ class FileLinker:
 
         # link pairs into tuples
         if 'pair' in self.data.params.datatype:
-            # check that names fit the paired naming convention
-            r1s = [i for i in self.fastqs if "_R1_" in i]
-            r2s = [i for i in self.fastqs if "_R2_" in i]
+            # classify files in one pass by the paired naming convention
+            r1s = []
+            r2s = set()
+            for path in self.fastqs:
+                if "_R1_" in path:
+                    r1s.append(path)
+                elif "_R2_" in path:
+                    r2s.add(path)
 
             # file checks
             if not r1s:
@@ -181,11 +193,12 @@ class FileLinker:
                 raise IPyradError(
                     R1_R2_name_error.format(len(r1s), len(r2s)))
 
-            # store tuples                    
+            # store tuples; pair by name lookup rather than a stat call
+            # per file, and sort so pairing order is deterministic.
             self.ftuples = []
-            for r1file in r1s:
+            for r1file in sorted(r1s):
                 r2file = r1file.replace("_R1_", "_R2_")
-                if not os.path.exists(r2file):
+                if r2file not in r2s:
                     raise IPyradError(
                         "Expected R2 file {} to match R1 file {}"
                         .format(r1file, r2file)
@@ -195,7 +208,7 @@ class FileLinker:
         # data are not paired, create empty tuple pair
         else:
             # print warning if _R2_ is in names when not paired
-            if any(["_R2_" in i for i in self.fastqs]):
+            if any("_R2_" in i for i in self.fastqs):
                 print(NAMES_LOOK_PAIRED_WARNING)
             self.ftuples = [(i, "") for i in self.fastqs]
 
@@ -203,8 +216,9 @@ class FileLinker:
     def remote_run_linker(self):
         "read in fastq files and count nreads for stats and chunking in s2."
 
-        # local counters 
+        # local counters
         createdinc = 0
+        created = []
 
         # iterate over input files
         for ftup in self.ftuples:
@@ -220,20 +234,22 @@ class FileLinker:
                 newsamp.files.fastqs = [ftup]
                 self.data.samples[sname] = newsamp
                 createdinc += 1
+                created.append(sname)
 
-        # send jobs to engines for counting with cat/zcat | wc
+        # send jobs to engines for counting with cat/zcat | wc. Only new
+        # samples need counting; re-linked samples keep their old count.
         rasyncs = {}
-        if createdinc:
-            for sample in self.data.samples.values():
+        for sname in created:
+            sample = self.data.samples[sname]
 
-                # get zip var
-                gzipped = bool(sample.files.fastqs[0][0].endswith(".gz"))
+            # get zip var
+            gzipped = bool(sample.files.fastqs[0][0].endswith(".gz"))
 
-                # submit job to count lines and store async
-                rasyncs[sample.name] = self.lbview.apply(
-                    zbufcountlines, 
-                    *(sample.files.fastqs[0][0], gzipped)
-                )
+            # submit job to count lines and store async
+            rasyncs[sample.name] = self.lbview.apply(
+                zbufcountlines,
+                *(sample.files.fastqs[0][0], gzipped)
+            )
 
         # wait for link jobs to finish if parallel
         start = time.time()
@@ -251,7 +267,6 @@ class FileLinker:
             res = rasyncs[sname].get() / 4
             self.data.samples[sname].stats.reads_raw = res
             self.data.samples[sname].stats_dfs.s1["reads_raw"] = res
-            self.data.samples[sname].state = 1
 
         # print if data were linked
         if createdinc:
@@ -285,7 +300,7 @@ class Demultiplexer:
     def __init__(self, step):
         self.data = step.data
         self.input = step.rfiles
-        self.fastqs = glob.glob(self.input)
+        self.fastqs = scanglob(self.input)
         self.ipyclient = step.ipyclient
         # single engine jobs
         self.iview = self.ipyclient.load_balanced_view(targets=[0])
@@ -455,7 +470,7 @@ class Demultiplexer:
                     break
 
                 # ntemp files written or being written
-                done = len(glob.glob(os.path.join(self.tmpdir, "chunk*_*_*")))
+                done = len(scanglob(os.path.join(self.tmpdir, "chunk*_*_*")))
                 self.data._progressbar(njobs, done, start, printstr)
                 time.sleep(0.5)
 
@@ -535,7 +550,7 @@ class Demultiplexer:
         self.data._progressbar(10, 0, start, printstr) 
 
         # get all the files
-        ftmps = glob.glob(os.path.join(
+        ftmps = scanglob(os.path.join(
             self.data.dirs.fastqs, 
             "tmpdir", 
             "tmp_*.fastq"))
@@ -558,15 +573,10 @@ class Demultiplexer:
             else:
                 r2dict[sname].append(ftmp)
 
-        ## concatenate files
-        snames = []
-        for sname in self.data.barcodes:
-            if "-technical-replicate-" in sname:
-                sname = sname.rsplit("-technical-replicate", 1)[0]
-            snames.append(sname)
-
+        ## concatenate files. r1dict keys are already the deduplicated
+        ## sample names built from the barcodes above.
         writers = []
-        for sname in set(snames):
+        for sname in r1dict:
             tmp1s = sorted(r1dict[sname])
             tmp2s = sorted(r2dict[sname])
             writers.append(
@@ -993,14 +1003,10 @@ def barmatch(args):
 def get_name_from_file(fname, splitnames, fields):
     "Grab Sample names from demultiplexed input fastq file names"
 
-    # allowed extensions
-    file_extensions = [".gz", ".fastq", ".fq", ".fasta", ".clustS", ".consens"]
     base, _ = os.path.splitext(os.path.basename(fname))
 
-    # remove read number from name
-    base = base.replace("_R1_.", ".")\
-               .replace("_R1_", "")\
-               .replace("_R1.", ".")
+    # remove read number from name in a single pass
+    base = READ1_RE.sub(lambda m: "." if m.group(0).endswith(".") else "", base)
 
     # To test running pe data as concatenated SE
     # 3/8/20 iao
@@ -1008,13 +1014,8 @@ def get_name_from_file(fname, splitnames, fields):
     #           .replace("_R2_", "")\
     #           .replace("_R2.", ".")
 
-    # remove extensions, retains '.' in file names.
-    while 1:
-        tmpb, tmpext = os.path.splitext(base)
-        if tmpext in file_extensions:        
-            base = tmpb
-        else:
-            break
+    # remove extensions in one match, retains other '.' in file names.
+    base = EXTENSIONS_RE.sub("", base)
 
     # split on 'splitnames' and select field 'fields'
     if fields:
@@ -1040,12 +1041,45 @@ def get_name_from_file(fname, splitnames, fields):
     return base
 
 
+def scanglob(pattern):
+    """
+    glob.glob replacement using os.scandir, which caches file type info
+    per entry instead of re-statting every match. Falls back to glob for
+    patterns with wildcards in the directory part.
+    """
+    dirname, basename = os.path.split(pattern)
+    if any(i in dirname for i in "*?["):
+        return glob.glob(pattern)
+    try:
+        entries = os.scandir(dirname or ".")
+    except OSError:
+        return []
+    return [
+        os.path.join(dirname, i.name) for i in entries
+        if fnmatch.fnmatch(i.name, basename) and i.is_file()
+    ]
+
+
 def zbufcountlines(filename, gzipped):
     "Fast line counter using unix utils"
-    if gzipped:
-        cmd1 = ["gunzip", "-c", filename]
+    # plain files: count newlines in a memory-mapped view with a numpy
+    # reduction (SIMD) rather than streaming bytes through a wc pipe.
+    if not gzipped:
+        with open(filename, 'rb') as infile:
+            if not os.fstat(infile.fileno()).st_size:
+                return 0
+            mm = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+            arr = np.frombuffer(mm, dtype=np.uint8)
+            nlines = int(np.count_nonzero(arr == 0x0A))
+            del arr
+            mm.close()
+        return nlines
+
+    # pigz inflates with multiple threads when it is installed
+    if shutil.which("pigz"):
+        cmd1 = ["pigz", "-dc", filename]
     else:
-        cmd1 = ["cat", filename]
+        cmd1 = ["gunzip", "-c", filename]
     cmd2 = ["wc"]
     proc1 = sps.Popen(cmd1, stdout=sps.PIPE, stderr=sps.PIPE)
     proc2 = sps.Popen(cmd2, stdin=proc1.stdout, stdout=sps.PIPE, stderr=sps.PIPE)
@@ -1153,10 +1187,7 @@ def collate_files(data, sname, tmp1s, tmp2s):
         cmd1 += [tmpfile]
 
     ## compression function
-    proc = sps.Popen(['which', 'pigz'], 
-        stderr=sps.PIPE, 
-        stdout=sps.PIPE).communicate()
-    if proc[0].strip():
+    if shutil.which("pigz"):
         compress = ["pigz"]
     else:
         compress = ["gzip"]
@@ -11,6 +11,7 @@ from __future__ import print_function
 import os
 import io
 import time
+import shutil
 import numpy as np
 import subprocess as sps
 from .utils import IPyradError, fullcomp
@@ -86,10 +87,7 @@ class Step2(object):
 
 
     def check_binaries(self):
-        cmd = ['which', 'cutadapt']
-        proc = sps.Popen(cmd, stderr=sps.PIPE, stdout=sps.PIPE)
-        comm = proc.communicate()[0]
-        if not comm:
+        if not shutil.which("cutadapt"):
             raise IPyradError("program 'cutadapt' not found.")
 
 
@@ -85,6 +85,10 @@ class ObjDict(dict):
     Object dictionary allows calling dictionaries in a more
     pretty and Python fashion for storing Assembly data
     """
+    # attributes live in the dict items, so skip the per-instance
+    # __dict__ these small containers would otherwise each carry.
+    __slots__ = ()
+
     def __getattr__(self, name):
         if name in self:
             return self[name]
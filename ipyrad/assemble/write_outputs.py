@@ -22,7 +22,7 @@ import numpy as np
 import pandas as pd
 import ipyrad
 from numba import njit
-from .utils import IPyradError, clustdealer, splitalleles, chroms2ints
+from .utils import IPyradError, splitalleles, chroms2ints
 from .utils import BTS, GETCONS, DCONS  # , bcomp
 
 # suppress the terrible h5 warning
@@ -204,11 +204,26 @@ class Step7:
     def get_chunksize(self):
         "get nloci and ncpus to chunk and distribute work across processors"
         # this file is inherited from step 6 to allow step7 branching.
-        with open(self.data.clust_database, 'r') as inloci:
+        # a single scan both counts loci and records the byte offsets of
+        # each cluster so that split_clusters() need not re-read the file.
+        self._starts = []
+        self._ends = []
+        with open(self.data.clust_database, 'rb') as inloci:
             # skip header
             inloci.readline()
-            # get nraw loci
-            self.nraws = sum(1 for i in inloci if i == "//\n") // 2
+            start = inloci.tell()
+            while 1:
+                pos = inloci.tell()
+                line = inloci.readline()
+                if not line:
+                    break
+                # clusters are separated by a pair of '//' lines
+                if line == b"//\n":
+                    inloci.readline()
+                    self._starts.append(start)
+                    self._ends.append(pos)
+                    start = inloci.tell()
+        self.nraws = len(self._starts)
 
         # chunk to approximately 4 chunks per core
         self.ncpus = len(self.ipyclient.ids)
@@ -268,131 +283,112 @@ class Step7:
     def collect_stats(self):
         "Collect results from Processor and write stats file."
 
-        # organize stats into dataframes 
-        ftable = pd.DataFrame(
-            columns=["total_filters", "applied_order", "retained_loci"],
-            index=[
-                "total_prefiltered_loci",
-                "filtered_by_rm_duplicates",
-                "filtered_by_max_indels",
-                "filtered_by_max_SNPs",
-                "filtered_by_max_shared_het",
-                "filtered_by_min_sample",  # "filtered_by_max_alleles",
-                "total_filtered_loci"],
-        )
-
-        # load pickled dictionaries into a dict
+        # load each pickled result dict and merge it into the global
+        # stats as it is read; popping entries frees each chunk dict
+        # instead of holding all of them in memory until the end.
         pickles = glob.glob(os.path.join(self.data.tmpdir, "*.p"))
-        pdicts = {}
-        for pkl in pickles:
-            with open(pkl, 'rb') as inp:
-                pdicts[pkl.rsplit("-", 1)[-1][:-2]] = pickle.load(inp)
-
-        # join dictionaries into global stats
-        afilts = np.concatenate([i['filters'] for i in pdicts.values()])
+        filtarrs = []
         lcovs = Counter({})
         scovs = Counter({})
         cvar = Counter({})
         cpis = Counter({})
         nbases = 0
-        for lcov in [i['lcov'] for i in pdicts.values()]:
-            lcovs.update(lcov)
-        for scov in [i['scov'] for i in pdicts.values()]:
-            scovs.update(scov)
-        for var in [i['var'] for i in pdicts.values()]:
-            cvar.update(var)
-        for pis in [i['pis'] for i in pdicts.values()]:
-            cpis.update(pis)
-        for count in [i['nbases'] for i in pdicts.values()]:
-            nbases += count
-
-        # make into nice DataFrames
-        ftable.iloc[0, :] = (0, 0, self.nraws)
-
-        # filter rm dups
-        ftable.iloc[1, 0:2] = afilts[:, 0].sum()
-        ftable.iloc[1, 2] = ftable.iloc[0, 2] - ftable.iloc[1, 1]
-        mask = afilts[:, 0]
-
-        # filter max indels
-        ftable.iloc[2, 0] = afilts[:, 1].sum()
-        ftable.iloc[2, 1] = afilts[~mask, 1].sum()
-        ftable.iloc[2, 2] = ftable.iloc[1, 2] - ftable.iloc[2, 1]
-        mask = afilts[:, 0:2].sum(axis=1).astype(np.bool_)
-
-        # filter max snps
-        ftable.iloc[3, 0] = afilts[:, 2].sum()
-        ftable.iloc[3, 1] = afilts[~mask, 2].sum()
-        ftable.iloc[3, 2] = ftable.iloc[2, 2] - ftable.iloc[3, 1]
-        mask = afilts[:, 0:3].sum(axis=1).astype(np.bool_)
-
-        # filter max shared H
-        ftable.iloc[4, 0] = afilts[:, 3].sum()
-        ftable.iloc[4, 1] = afilts[~mask, 3].sum()
-        ftable.iloc[4, 2] = ftable.iloc[3, 2] - ftable.iloc[4, 1]
-        mask = afilts[:, 0:4].sum(axis=1).astype(np.bool_)
-
-        # filter minsamp
-        ftable.iloc[5, 0] = afilts[:, 4].sum()
-        ftable.iloc[5, 1] = afilts[~mask, 4].sum()
-        ftable.iloc[5, 2] = ftable.iloc[4, 2] - ftable.iloc[5, 1]
-        mask = afilts[:, 0:4].sum(axis=1).astype(np.bool_)
-
-        ftable.iloc[6, 0] = ftable.iloc[:, 0].sum()
-        ftable.iloc[6, 1] = ftable.iloc[:, 1].sum()
-        ftable.iloc[6, 2] = ftable.iloc[5, 2]
+        for pkl in pickles:
+            with open(pkl, 'rb') as inp:
+                pdict = pickle.load(inp)
+            filtarrs.append(pdict.pop("filters"))
+            lcovs.update(pdict.pop("lcov"))
+            scovs.update(pdict.pop("scov"))
+            cvar.update(pdict.pop("var"))
+            cpis.update(pdict.pop("pis"))
+            nbases += pdict.pop("nbases")
+        afilts = np.concatenate(filtarrs)
+
+        # compute filter table columns as arrays and construct the
+        # DataFrame once, rather than filling cells one at a time.
+        totals = np.zeros(7, dtype=np.int64)
+        applied = np.zeros(7, dtype=np.int64)
+        retained = np.zeros(7, dtype=np.int64)
+        retained[0] = self.nraws
+
+        # filters applied in order (rm dups, max indels, max snps, max
+        # shared H, minsamp) with a running mask of already-filtered
+        # loci, instead of re-summing the prefix columns on every step.
+        mask = np.zeros(afilts.shape[0], dtype=np.bool_)
+        for fidx in range(5):
+            totals[fidx + 1] = afilts[:, fidx].sum()
+            applied[fidx + 1] = afilts[~mask, fidx].sum()
+            retained[fidx + 1] = retained[fidx] - applied[fidx + 1]
+            mask |= afilts[:, fidx]
+
+        totals[6] = totals.sum()
+        applied[6] = applied.sum()
+        retained[6] = retained[5]
+
+        ftable = pd.DataFrame(
+            {
+                "total_filters": totals,
+                "applied_order": applied,
+                "retained_loci": retained,
+            },
+            index=FILTERS_TABLE_INDEX,
+        )
 
         # save stats to the data object
         self.data.stats_dfs.s7_filters = ftable
         self.data.stats_dfs.s7_samples = pd.DataFrame(
             pd.Series(scovs, name="sample_coverage"))
 
-        ## get locus cov and sums 
-        lrange = range(1, len(self.samples) + 1)
+        ## get locus cov and sums
+        ntaxa = len(self.samples)
+        lrange = range(1, ntaxa + 1)
         covs = pd.Series(lcovs, name="locus_coverage", index=lrange)
         start = self.data.params.min_samples_locus - 1
-        sums = pd.Series(
-            {i: np.sum(covs[start:i]) for i in lrange},            
-            name="sum_coverage", 
-            index=lrange)
+        # vectorized running sum over coverage bins; bins below the
+        # minsamp start point do not contribute to the sum.
+        cumcovs = np.cumsum(covs.values)
+        sumcovs = cumcovs - (cumcovs[start - 1] if start else 0)
+        sumcovs[:start] = 0
+        sums = pd.Series(sumcovs, name="sum_coverage", index=lrange)
         self.data.stats_dfs.s7_loci = pd.concat([covs, sums], axis=1)
 
-        # fill pis to match var
-        for i in cvar:
-            if not cpis.get(i):
-                cpis[i] = 0
-
-        ## get SNP distribution       
-        sumd = {}
-        sump = {}
-        for i in range(max(cvar.keys()) + 1):
-            sumd[i] = np.sum([i * cvar[i] for i in range(i + 1)])
-            sump[i] = np.sum([i * cpis[i] for i in range(i + 1)])        
-        self.data.stats_dfs.s7_snps = pd.concat([
-            pd.Series(cvar, name="var"),
+        ## get SNP distribution
+        # scatter Counter keys/values into dense arrays over all bins
+        # (unobserved bins fill as zero, so no need to pad pis to var)
+        maxsnps = max(cvar.keys())
+        varcounts = np.zeros(maxsnps + 1, dtype=np.int64)
+        varcounts[np.fromiter(cvar.keys(), dtype=np.int64)] = (
+            np.fromiter(cvar.values(), dtype=np.int64))
+        piscounts = np.zeros(maxsnps + 1, dtype=np.int64)
+        piscounts[np.fromiter(cpis.keys(), dtype=np.int64)] = (
+            np.fromiter(cpis.values(), dtype=np.int64))
+
+        # weighted cumulative sums of nsnps per locus bin
+        bins = np.arange(maxsnps + 1)
+        sumd = np.cumsum(bins * varcounts)
+        sump = np.cumsum(bins * piscounts)
+        s7_snps = pd.concat([
+            pd.Series(varcounts, name="var"),
             pd.Series(sumd, name="sum_var"),
-            pd.Series(cpis, name="pis"),
+            pd.Series(piscounts, name="pis"),
             pd.Series(sump, name="sum_pis"),
-            ],          
+            ],
             axis=1
         )
 
         # trim SNP distribution to exclude unobserved endpoints
         snpmax = np.where(
-            np.any(
-                self.data.stats_dfs.s7_snps.loc[:, ["var", "pis"]] != 0, axis=1
-                )
-            )[0]
+            np.any(s7_snps.loc[:, ["var", "pis"]] != 0, axis=1))[0]
         if snpmax.size:
             snpmax = snpmax.max()
-            self.data.stats_dfs.s7_snps = (
-                self.data.stats_dfs.s7_snps.loc[:snpmax])
+            s7_snps = s7_snps.loc[:snpmax]
+        self.data.stats_dfs.s7_snps = s7_snps
 
-        ## store dimensions for array building 
+        ## store dimensions for array building
         self.nloci = ftable.iloc[6, 2]
         self.nbases = nbases
-        self.nsnps = self.data.stats_dfs.s7_snps["sum_var"].max()
-        self.ntaxa = len(self.samples)
+        self.nsnps = s7_snps["sum_var"].max()
+        self.ntaxa = ntaxa
 
         # write to file
         with open(self.data.stats_files.s7, 'w') as outstats:
@@ -421,37 +417,18 @@ class Step7:
 
 
     def split_clusters(self):
-        with open(self.data.clust_database, 'rb') as clusters:
-            # skip header
-            clusters.readline()
-
-            # build iterator
-            pairdealer = izip(*[iter(clusters)] * 2)
-
-            # grab a chunk of clusters
-            idx = 0
-            while 1:
-
-                # if an engine is available pull off a chunk
-                try:
-                    done, chunk = clustdealer(pairdealer, self.chunksize)
-                except IndexError:
-                    raise IPyradError(
-                        "clust_database formatting error in %s", chunk)
-
-                # write to tmpdir and increment counter
-                if chunk:
-                    chunkpath = os.path.join(
-                        self.data.tmpdir, 
-                        "chunk-{}".format(idx),
-                        )
-                    with open(chunkpath, 'wb') as outfile:
-                        outfile.write(b"//\n//\n".join(chunk))
-                    idx += 1
-
-                # break on final chunk
-                if done:
-                    break
+        """
+        Groups the cluster byte offsets recorded in get_chunksize() into
+        chunks of chunksize loci. Engines seek and read their span
+        directly from the clust_database so no chunk files are written.
+        """
+        self.chunks = []
+        if not self.nraws:
+            return
+        for lidx in range(0, self.nraws, self.chunksize):
+            start = self._starts[lidx]
+            cend = self._ends[min(lidx + self.chunksize, self.nraws) - 1]
+            self.chunks.append((len(self.chunks), start, cend - start))
 
 
     def remote_process_chunks(self):
@@ -460,28 +437,41 @@ class Step7:
         """
         start = time.time()
         printstr = ("applying filters    ", "s7")
-        rasyncs = {}
 
-        jobs = glob.glob(os.path.join(self.data.tmpdir, "chunk-*"))
-        jobs = sorted(jobs, key=lambda x: int(x.rsplit("-")[-1]))        
-        for jobfile in jobs:
-            args = (self.data, self.chunksize, jobfile)
-            rasyncs[jobfile] = self.lbview.apply(process_chunk, *args)
+        # byte spans into the clust_database recorded by split_clusters
+        jobs = self.chunks
+
+        # pickle the Assembly once; engines load it from the shared
+        # filesystem instead of receiving a full copy in every message.
+        # (.pkl so it is not collected with the chunk-*.p stats pickles)
+        datafile = os.path.join(self.data.tmpdir, "s7-data.pkl")
+        with open(datafile, 'wb') as pout:
+            pickle.dump(self.data, pout)
+
+        # batch jobs with map so engines dequeue several small chunks
+        # per message instead of paying dispatch cost per chunk.
+        njobs = len(jobs)
+        batch = max(1, njobs // (self.ncpus * 4))
+        rasync = self.lbview.map_async(
+            process_chunk,
+            [datafile] * njobs,
+            [self.chunksize] * njobs,
+            jobs,
+            chunksize=batch,
+        )
 
         # iterate until all chunks are processed
         while 1:
-            # get and enter results into hdf5 as they come in
-            ready = [rasyncs[i].ready() for i in rasyncs]
-            self.data._progressbar(len(ready), sum(ready), start, printstr)
+            done = min(njobs, rasync.progress * batch)
+            self.data._progressbar(njobs, done, start, printstr)
             time.sleep(0.5)
-            if len(ready) == sum(ready):
+            if rasync.ready():
+                self.data._progressbar(njobs, njobs, start, printstr)
                 self.data._print("")
-                break          
+                break
 
-        # write stats       
-        for job in rasyncs:
-            if not rasyncs[job].successful():
-                rasyncs[job].get()
+        # raises an error here if any of the chunk jobs failed
+        rasync.get()
 
 
     def remote_build_arrays_and_write_loci(self):
@@ -602,9 +592,13 @@ class Step7:
 # ------------------------------------------------------------
 # Classes initialized and run on remote engines.
 # ------------------------------------------------------------
-def process_chunk(data, chunksize, chunkfile):
+def process_chunk(datafile, chunksize, chunk):
+    # load the Assembly object pickled once by remote_process_chunks
+    with open(datafile, 'rb') as pin:
+        data = pickle.load(pin)
+
     # process chunk writes to files and returns proc with features.
-    proc = Processor(data, chunksize, chunkfile)
+    proc = Processor(data, chunksize, chunk)
     proc.run()
 
     # check for variants or set max to 0
@@ -641,16 +635,16 @@ def process_chunk(data, chunksize, chunkfile):
 ##############################################################
 
 class Processor(object):
-    def __init__(self, data, chunksize, chunkfile):
+    def __init__(self, data, chunksize, chunk):
         """
-        Takes a chunk of aligned loci and (1) applies filters to it; 
+        Takes a chunk of aligned loci and (1) applies filters to it;
         (2) gets edges, (3) builds snpstring, (4) returns chunk and stats.
-        (5) writes 
+        (5) writes
         """
         # init data
         self.data = data
         self.chunksize = chunksize
-        self.chunkfile = chunkfile
+        self.chunkidx, self.chunkstart, self.chunkbytes = chunk
         self.isref = self.data.isref
         self.ispair = self.data.ispair
         self.minsamp = self.data.params.min_samples_locus
@@ -704,15 +698,19 @@ class Processor(object):
         self.pis = {i: 0 for i in range(5000)}
         self.nbases = 0
 
-        # tmp outfile list and filename
+        # tmp outfile list and filenames
         self.outlist = []
-        self.outfile = self.chunkfile + '.loci'
-        self.outpickle = self.chunkfile + '.p'
-        self.outarr = self.chunkfile + '.npy'
-
-        # open a generator to the chunks
-        self.io = open(self.chunkfile, 'rb')
-        self.loci = enumerate(iter(self.io.read().split(b"//\n//\n")))
+        handle = os.path.join(
+            self.data.tmpdir, "chunk-{}".format(self.chunkidx))
+        self.outfile = handle + '.loci'
+        self.outpickle = handle + '.p'
+        self.outarr = handle + '.npy'
+
+        # open a generator to this chunk's span of the clust database
+        self.io = open(self.data.clust_database, 'rb')
+        self.io.seek(self.chunkstart)
+        self.loci = enumerate(
+            iter(self.io.read(self.chunkbytes).split(b"//\n//\n")))
 
         # filled in each chunk
         self.names = []
@@ -1446,6 +1444,10 @@ class Converter:
                 # access array of data
                 maparr = io5["snpsmap"]
 
+                # get chroms dict once, not once per chunk
+                if self.data.isref:
+                    revdict = chroms2ints(self.data, 1)
+
                 ## write to map file in chunks of 10000
                 for start in range(0, maparr.shape[0], 10000):
                     outchunk = []
@@ -1455,7 +1457,6 @@ class Converter:
 
                     # get chroms
                     if self.data.isref:
-                        revdict = chroms2ints(self.data, 1)
                         for i in rdat:
                             outchunk.append(
                                 "{}\t{}:{}\t{}\t{}\n"
@@ -2680,6 +2681,17 @@ def subsample(snpsmap):
 
 AMBIGARR = np.array(list(bytes(b"RSKYWM"))).astype(np.uint8)
 
+# row labels of the s7_filters stats table
+FILTERS_TABLE_INDEX = [
+    "total_prefiltered_loci",
+    "filtered_by_rm_duplicates",
+    "filtered_by_max_indels",
+    "filtered_by_max_SNPs",
+    "filtered_by_max_shared_het",
+    "filtered_by_min_sample",  # "filtered_by_max_alleles",
+    "total_filtered_loci",
+]
+
 STATS_HEADER_1 = """
 ## The number of loci caught by each filter.
 ## ipyrad API location: [assembly].stats_dfs.s7_filters
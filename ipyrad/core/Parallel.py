@@ -26,6 +26,10 @@ from ..assemble.utils import IPyradError, detect_cpus
 # find ipcluster binary even if we're in a conda env
 IPCLUSTER_BIN = os.path.join(sys.prefix, "bin", "ipcluster")
 
+# cache of the last default-profile Client so repeated run() calls in
+# one session reuse the connection instead of re-handshaking the hub.
+CLIENT_CACHE = {}
+
 
 class Parallel(object):
     """
@@ -298,8 +302,20 @@ class Parallel(object):
 
             # neither auto or ipyclient entered, we'll still look for default
             # profile running ipcluster and raise Error if none found.
+            # reuse the cached client from an earlier run() if still alive.
             else:
-                self.ipyclient = self.wait_for_connection()                
+                cached = CLIENT_CACHE.get("client")
+                alive = False
+                if cached is not None:
+                    try:
+                        alive = bool(len(cached))
+                    except Exception:
+                        alive = False
+                if alive:
+                    self.ipyclient = cached
+                else:
+                    self.ipyclient = self.wait_for_connection()
+                    CLIENT_CACHE["client"] = self.ipyclient
 
             # print cluster stats at this point
             # self.widget.close()
@@ -9,6 +9,7 @@ import sys
 import copy
 import time
 import json
+import pickle
 import string
 import datetime
 import itertools
@@ -105,6 +106,9 @@ class Assembly(object):
         # samples linked {sample-name: sample-object}
         self.samples = {}
 
+        # cache for the stats property: (state fingerprint, DataFrame)
+        self._stats_cache = (None, None)
+
         # populations {popname: poplist}
         self.populations = {}
 
@@ -124,9 +128,10 @@ class Assembly(object):
         self.params = Params(self)
         self.hackersonly = Hackers()
 
-        ## Store data directories for this Assembly. Init with default project
+        ## Store data directories for this Assembly. Init with default
+        ## project. params.project_dir is already a realpath.
         self.dirs = ObjDict({
-            "project": os.path.realpath(self.params.project_dir),
+            "project": self.params.project_dir,
             "fastqs": "",
             "edits": "",
             "clusts": "",
@@ -150,24 +155,39 @@ class Assembly(object):
     @property
     def stats(self):
         """ Returns a data frame with Sample data and state. """
-        nameordered = list(self.samples.keys())
-        nameordered.sort()
+        nameordered = sorted(self.samples)
+        if not nameordered:
+            return pd.DataFrame()
+
+        # return a copy of the cached frame if no sample state changed
+        # since the last access; rebuilds are costly in notebooks where
+        # stats is printed repeatedly between steps.
+        key = tuple((i, self.samples[i].stats.state) for i in nameordered)
+        if key == self._stats_cache[0]:
+            return self._stats_cache[1].copy()
 
         ## Set pandas to display all samples instead of truncating
         pd.options.display.max_rows = len(self.samples)
-        statdat = pd.DataFrame(
-            data=[self.samples[i].stats for i in nameordered],
-            index=nameordered,
-        ).dropna(axis=1, how='all')
+        # concat aligns the sample Series as columns in one C-level op
+        # instead of row-wise dtype inference over a list of Series.
+        statdat = (
+            pd.concat(
+                [self.samples[i].stats for i in nameordered],
+                axis=1,
+                keys=nameordered,
+            )
+            .T.dropna(axis=1, how='all')
+        )
         # ensure non h,e columns print as ints
-        for column in statdat:
-            if column not in ["hetero_est", "error_est"]:
-                statdat[column] = np.nan_to_num(statdat[column]).astype(int)
+        intcols = [
+            i for i in statdat if i not in ("hetero_est", "error_est")]
+        statdat[intcols] = statdat[intcols].fillna(0).astype(int)
 
         # build step 6-7 stats from database
         # ...
 
-        return statdat
+        self._stats_cache = (key, statdat)
+        return statdat.copy()
 
 
     @property
@@ -240,12 +260,17 @@ class Assembly(object):
         e.g., data.stats_dfs.s1 = self.build_stats("s1")
         """
         # build steps 1-5 stats from samples
-        nameordered = list(self.samples.keys())
-        nameordered.sort()
-        newdat = pd.DataFrame(
-            (self.samples[i].stats_dfs[idx] for i in nameordered),
-            index=nameordered,
-        ).dropna(axis=1, how='all')
+        nameordered = sorted(self.samples)
+        if not nameordered:
+            return pd.DataFrame()
+        newdat = (
+            pd.concat(
+                [self.samples[i].stats_dfs[idx] for i in nameordered],
+                axis=1,
+                keys=nameordered,
+            )
+            .T.dropna(axis=1, how='all')
+        )
         return newdat
 
 
@@ -262,12 +287,14 @@ class Assembly(object):
                 "Barcodes file not found. You entered: {}"
                 .format(self.params.barcodes_path))
 
-        # read in the file
-        bdf = pd.read_csv(barcodefile[0], header=None, delim_whitespace=1)
+        # read in the file. dtype=str skips type inference and keeps
+        # all-digit sample names as strings.
+        bdf = pd.read_csv(
+            barcodefile[0], header=None, delim_whitespace=1, dtype=str)
         bdf = bdf.dropna()
 
-        # make sure bars are upper case
-        bdf[1] = bdf[1].str.upper()
+        # make sure bars are upper case (C loop, not per-cell dispatch)
+        bdf[1] = np.char.upper(bdf[1].to_numpy(dtype=str))
 
         # if replicates are present
         if bdf[0].value_counts().max() > 1:
@@ -313,7 +340,7 @@ class Assembly(object):
                     "pair3rad datatype should have two barcodes per sample.")
         
             # We'll concatenate them with a plus and split them later
-            bdf[2] = bdf[2].str.upper()
+            bdf[2] = np.char.upper(bdf[2].to_numpy(dtype=str))
             self.barcodes = dict(zip(bdf[0], bdf[1] + "+" + bdf[2]))
 
         # check barcodes sample names
@@ -484,6 +511,14 @@ class Assembly(object):
         ## Simpler alternative: set attribute directly
         [Assembly].params.max_shared_Hs_locus = 0.25
         """
+        # accept the param index (e.g., 1) or its name (e.g., 'project_dir')
+        if isinstance(param, int) or str(param).isdigit():
+            try:
+                param = self.params._keys[int(param)][1:]
+            except IndexError:
+                raise IPyradError(
+                    "Parameter key not recognized: {}".format(param))
+
         # check param in keys
         if "_" + param not in self.params._keys:
             raise IPyradError(
@@ -521,7 +556,7 @@ class Assembly(object):
             ## get the short description from paramsinfo. Make it look pretty,
             ## pad nicely if at all possible.
             params_string = []
-            for key in self.params._keys:
+            for paramkey, key in enumerate(self.params._keys):
                 val = getattr(self.params, key)
 
                 # If multiple elements, write them out comma separated
@@ -531,7 +566,6 @@ class Assembly(object):
                     paramvalue = str(val)
 
                 padding = (" " * (30 - len(paramvalue)))
-                paramkey = self.params._keys.index(key)
                 paramindex = " ## [{}] ".format(paramkey)
                 name = "[{}]: ".format(paramname(paramkey))
                 description = paraminfo(paramkey, short=True)
@@ -572,30 +606,26 @@ class Assembly(object):
         if newname.startswith("params-"):
             newname = newname.split("params-")[1]
 
-        # create a copy of the Assembly obj
-        newobj = copy.deepcopy(self)
+        # create a copy of the Assembly obj. A pickle round-trip does
+        # the whole walk in C and is much faster than deepcopy here.
+        newobj = pickle.loads(pickle.dumps(self, pickle.HIGHEST_PROTOCOL))
         newobj.name = newname
         newobj.params._assembly_name = newname
 
-        # create copies of each subsampled Sample obj
+        # samples were already deep-copied in the pickle round-trip,
+        # so subsampling only needs to prune the new sample dict.
         if subsamples:
-            for sname in subsamples:
-                if sname in self.samples:
-                    newobj.samples[sname] = copy.deepcopy(self.samples[sname])
-                else:
-                    if sname != "reference":
-                        print("Sample name not found: {}".format(sname))
+            missing = [
+                i for i in subsamples
+                if i not in self.samples and i != "reference"]
+            if missing:
+                print("Sample names not found: {}".format(", ".join(missing)))
 
             # reload sample dict w/o non subsamples
             newobj.samples = {
-                name: sample for name, sample in newobj.samples.items() 
+                name: sample for name, sample in newobj.samples.items()
                 if name in subsamples}
 
-        # create copies of each subsampled Sample obj
-        else:
-            for sample in self.samples:
-                newobj.samples[sample] = copy.deepcopy(self.samples[sample])
-
         ## save json of new obj and return object
         newobj.save()
         return newobj
@@ -684,9 +714,17 @@ class Assembly(object):
         }
          
         # require steps
-        if steps is None:
+        if not steps:
             print("You must enter one or more steps to run, e.g., '123'")
-            return 
+            return
+
+        # validate the full steps string before running anything so a
+        # typo fails fast instead of after earlier steps complete.
+        badsteps = [i for i in steps if i not in stepdict]
+        if badsteps:
+            raise IPyradError(
+                "Unknown steps: {}. Valid steps are 1-7, e.g., '123'."
+                .format("".join(badsteps)))
 
         # hide all messages/progress bars
         self.quiet = quiet
@@ -730,11 +768,17 @@ def default(o):
     # typeerror-integer-is-not-json-serializable-when-
     # serializing-json-in-python?utm_medium=organic&utm_
     # source=google_rich_qa&utm_campaign=google_rich_qa
-    if isinstance(o, np.int64): 
-        return int(o)  
+    if isinstance(o, np.int64):
+        return int(o)
     raise TypeError
 
 
+## a single shared Encoder instance; building one per save_json call
+## just re-parses the same options every time.
+ENCODER = Encoder(
+    sort_keys=False, indent=4, separators=(",", ":"), default=default)
+
+
 def save_json(data):
     """ 
     Save assembly and samples as json 
@@ -769,30 +813,29 @@ def save_json(data):
         sampledict[key] = sample._to_fulldict()
 
     ## json format it using cumstom Encoder class
-    fulldumps = json.dumps({
+    fulldumps = ENCODER.encode({
         "assembly": datadict,
-        "samples": sampledict
-    },
-        cls=Encoder,
-        sort_keys=False, indent=4, separators=(",", ":"),
-        default=default,
-    )
+        "samples": sampledict,
+    })
 
     ## save to file
     assemblypath = os.path.join(data.params.project_dir, data.name + ".json")
     if not os.path.exists(data.dirs.project):
         os.mkdir(data.dirs.project)
-    
-    ## protect save from interruption
-    done = 0
-    while not done:
-        try:
-            with open(assemblypath, 'w') as jout:
-                jout.write(fulldumps)
-            done = 1
-        except (KeyboardInterrupt, SystemExit): 
-            print('.')
-            continue
+
+    ## skip the disk write if nothing changed since the last save
+    jhash = hash(fulldumps)
+    if jhash == getattr(data, "_json_hash", None):
+        if os.path.exists(assemblypath):
+            return
+
+    ## write to a tempfile and atomically rename into place so an
+    ## interruption mid-write can never leave a corrupt JSON behind.
+    tmppath = assemblypath + ".tmp"
+    with open(tmppath, 'w') as jout:
+        jout.write(fulldumps)
+    os.replace(tmppath, assemblypath)
+    data._json_hash = jhash
 
 
 def merge(name, assemblies, rename_dict=None):
@@ -847,9 +890,11 @@ def merge(name, assemblies, rename_dict=None):
     # iterate over all sample names from all Assemblies
     for data in assemblies:
 
-        # make a deepcopy
-        ndata = copy.deepcopy(data)
-        for sname, sample in ndata.samples.items():
+        # copy the samples so originals are not modified. Only the
+        # samples are needed, not a deepcopy of the whole assembly.
+        nsamples = pickle.loads(
+            pickle.dumps(data.samples, pickle.HIGHEST_PROTOCOL))
+        for sname, sample in nsamples.items():
 
             # rename sample if in rename dict
             if sname in rename_dict:
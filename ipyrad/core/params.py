@@ -24,6 +24,18 @@ OUTPUT_FORMATS = {
 }
 
 
+def _expand(value):
+    "expand user and relative path parts of a path param"
+    return os.path.realpath(os.path.expanduser(value))
+
+
+def _path_matches(fullpath):
+    "existence check that only pays for a glob on wildcard paths"
+    if any(i in fullpath for i in "*?["):
+        return bool(glob.glob(fullpath))
+    return os.path.exists(fullpath)
+
+
 class Hackers(object):
     def __init__(self):
 
@@ -243,13 +255,16 @@ class Params(object):
 
         
     def __repr__(self):
-        fullcurdir = os.path.realpath(os.path.curdir)
+        fullcurdir = os.path.realpath(os.path.curdir) + "/"
+        home = os.path.expanduser("~")
         printstr = ""
         for idx, key in enumerate(self._keys):
             value = self.__getattribute__(key)
             if isinstance(value, str):
-                value = value.replace(fullcurdir + "/", "./")
-                value = value.replace(os.path.expanduser("~"), "~")
+                if value.startswith(fullcurdir):
+                    value = value.replace(fullcurdir, "./")
+                if value.startswith(home):
+                    value = value.replace(home, "~")
             printstr += "{:<4}{:<28}{:<45}\n".format(idx, key[1:], str(value))
         return printstr
 
@@ -282,7 +297,7 @@ class Params(object):
     def project_dir(self, value):
         if " " in value:
             raise IPyradError(BAD_PROJDIR_NAME.format(value))
-        self._project_dir = os.path.realpath(os.path.expanduser(value))
+        self._project_dir = _expand(value)
         self._data.dirs.project = self._project_dir
 
 
@@ -294,10 +309,10 @@ class Params(object):
 
         # check path
         if value and ("Merged:" not in value):
-            fullpath = os.path.realpath(os.path.expanduser(value))
+            fullpath = _expand(value)
             if os.path.isdir(fullpath):
                 raise IPyradError(RAW_PATH_ISDIR.format(fullpath))
-            elif glob.glob(fullpath):
+            elif _path_matches(fullpath):
                 self._raw_fastq_path = fullpath
             else:
                 raise IPyradError(NO_RAW_FILE.format(fullpath))
@@ -315,7 +330,7 @@ class Params(object):
         if value and ("Merged:" not in value):
 
             # allow fuzzy name match
-            fullbar = glob.glob(os.path.realpath(os.path.expanduser(value)))
+            fullbar = glob.glob(_expand(value))
             if not fullbar:
                 raise IPyradError(BARCODE_NOT_FOUND.format(value))
 
@@ -339,10 +354,10 @@ class Params(object):
     @sorted_fastq_path.setter
     def sorted_fastq_path(self, value):
         if value and ("Merged:" not in value):
-            fullpath = os.path.realpath(os.path.expanduser(value))
+            fullpath = _expand(value)
             if os.path.isdir(fullpath):
                 raise IPyradError(SORTED_ISDIR.format(fullpath))
-            elif glob.glob(fullpath):
+            elif _path_matches(fullpath):
                 self._sorted_fastq_path = fullpath
             else:
                 raise IPyradError(SORTED_NOT_FOUND.format(fullpath))
@@ -367,7 +382,7 @@ class Params(object):
     @reference_sequence.setter
     def reference_sequence(self, value):
         if value:
-            fullpath = os.path.realpath(os.path.expanduser(value))
+            fullpath = _expand(value)
             if not os.path.exists(fullpath):
                 raise IPyradError("reference sequence file not found")
             if fullpath.endswith(".gz"):
@@ -707,7 +722,7 @@ class Params(object):
         return self._pop_assign_file
     @pop_assign_file.setter
     def pop_assign_file(self, value):
-        fullpath = os.path.realpath(os.path.expanduser(value))
+        fullpath = _expand(value)
 
         # if a path is entered, raise exception if not found
         if value:
@@ -732,7 +747,7 @@ class Params(object):
     @reference_as_filter.setter
     def reference_as_filter(self, value):
         if value:
-            fullpath = os.path.realpath(os.path.expanduser(value))
+            fullpath = _expand(value)
             if not os.path.exists(fullpath):
                 raise IPyradError("reference sequence file not found")
             if fullpath.endswith(".gz"):
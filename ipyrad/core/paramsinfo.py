@@ -11,6 +11,7 @@
 
 from __future__ import print_function
 from collections import OrderedDict
+from functools import lru_cache
 
 
 pinfo = OrderedDict([
@@ -406,6 +407,7 @@ pinfo = OrderedDict([
 
 ])
 
+@lru_cache(maxsize=None)
 def paramname(param=""):
     """ Get the param name from the dict index value.
     """
@@ -424,8 +426,9 @@ def paramname(param=""):
     return name
 
 
+@lru_cache(maxsize=None)
 def paraminfo(param="", short=False):
-    """ Returns detailed information for the numbered parameter. 
+    """ Returns detailed information for the numbered parameter.
         Further information is available in the tutorial.
         Unlike params() this function doesn't deal well with *
         It only takes one parameter at a time and returns the desc